@@ -31,6 +31,8 @@ from typing import Any  # noqa
 from flask import Flask
 from flask_login import LoginManager
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine.url import make_url
 
 from freshmaker.logger import init_logging, setup_logger
 from freshmaker.config import init_config
@@ -46,8 +48,29 @@ app.wsgi_app = ReverseProxy(app.wsgi_app)
 
 conf = init_config(app)
 
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_driver_name() == 'psycopg2':
+    # Let psycopg2 send the executemany() INSERTs and UPDATEs issued by the
+    # ORM flush as pages of multi-row statements instead of one statement
+    # per row.
+    engine_options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    engine_options.setdefault('executemany_mode', 'values_plus_batch')
+    engine_options.setdefault('executemany_batch_page_size', 1000)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
 db = SQLAlchemy(app)  # type: Any
 
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_driver_name() == 'pysqlite':
+    # pysqlite emits BEGIN lazily before the first DML statement only, so a
+    # SAVEPOINT issued first would start the transaction and its RELEASE
+    # would commit it. Disable that and emit BEGIN explicitly instead.
+    @event.listens_for(db.engine, 'connect')
+    def _sqlite_disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(db.engine, 'begin')
+    def _sqlite_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
 init_logging(conf)
 setup_logger()
 log = getLogger(__name__)
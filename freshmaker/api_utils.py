@@ -21,6 +21,7 @@
 
 import copy
 from flask import request, url_for, jsonify
+from sqlalchemy.orm import selectinload
 
 from freshmaker import db
 from freshmaker.errors import ValidationError
@@ -158,7 +159,7 @@ def filter_artifact_builds(flask_request):
         if flask_request.args.get(key, None):
             search_query[key] = flask_request.args[key]
 
-    query = ArtifactBuild.query
+    query = ArtifactBuild.query.options(*ArtifactBuild.json_load_options())
 
     if search_query:
         query = query.filter_by(**search_query)
@@ -190,7 +191,8 @@ def filter_events(flask_request):
     :return: flask_sqlalchemy.Pagination
     """
 
-    query = Event.query
+    query = Event.query.options(
+        selectinload(Event.dependencies), selectinload(Event.dependents))
 
     for key in ['message_id', 'search_key', 'event_type_id', 'requester']:
         values = flask_request.args.getlist(key)
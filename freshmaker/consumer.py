@@ -29,6 +29,7 @@ import fedmsg.consumers
 import moksha.hub
 
 from freshmaker import log, conf, messaging, events, app
+from freshmaker.models import transactional
 from freshmaker.monitor import (
     messaging_rx_counter, messaging_rx_ignored_counter,
     messaging_rx_processed_ok_counter, messaging_rx_failed_counter)
@@ -157,7 +158,10 @@ class FreshmakerConsumer(fedmsg.consumers.FedmsgConsumer):
             idx = "%s: %s, %s" % (type(handler).__name__, type(msg).__name__, msg.msg_id)
             log.debug("Calling %s" % idx)
             try:
-                further_work = handler.handle(msg) or []
+                # Changes left uncommitted by the handler are committed once
+                # it finishes, or rolled back if it fails.
+                with transactional():
+                    further_work = handler.handle(msg) or []
             except Exception:
                 err = 'Could not process message handler. See the traceback.'
                 log.exception(err)
@@ -22,7 +22,6 @@
 # Written by Jan Kaluza <jkaluza@redhat.com>
 
 import abc
-import json
 import re
 import copy
 from functools import wraps
@@ -223,7 +222,9 @@ class BaseHandler(object):
 
     @property
     def current_db_event(self):
-        return db.session.query(Event).filter_by(id=self.current_db_event_id).first()
+        if self.current_db_event_id is None:
+            return None
+        return db.session.get(Event, self.current_db_event_id)
 
     @property
     def current_db_artifact_build_id(self):
@@ -530,7 +531,7 @@ class ContainerBuildHandler(BaseHandler):
                         "Original image has invalid openshift versions range")
                     return
 
-        args = json.loads(build.build_args)
+        args = build.build_args
         scm_url = "%s/%s#%s" % (conf.git_base_url, args["repository"],
                                 args["commit"])
         branch = args["branch"]
@@ -19,7 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import copy
-import json
 from datetime import datetime
 import re
 
@@ -626,20 +625,18 @@ class HandleBotasAdvisory(ContainerBuildHandler):
             build.transition(ArtifactBuildState.PLANNED.value, "")
 
             additional_data = ContainerImage.get_additional_data_from_koji(bundle["nvr"])
-            build.build_args = json.dumps(
-                {
-                    "repository": additional_data["repository"],
-                    "commit": additional_data["commit"],
-                    "target": additional_data["target"],
-                    "branch": additional_data["git_branch"],
-                    "arches": additional_data["arches"],
-                    # The build system always enforces that bundle images build from
-                    # "scratch", so there is no parent image. See:
-                    # https://osbs.readthedocs.io/en/latest/users.html?#operator-manifest-bundle-builds
-                    "original_parent": None,
-                    "operator_csv_modifications_url": csv_mod_url.format(build.id),
-                }
-            )
+            build.build_args = {
+                "repository": additional_data["repository"],
+                "commit": additional_data["commit"],
+                "target": additional_data["target"],
+                "branch": additional_data["git_branch"],
+                "arches": additional_data["arches"],
+                # The build system always enforces that bundle images build from
+                # "scratch", so there is no parent image. See:
+                # https://osbs.readthedocs.io/en/latest/users.html?#operator-manifest-bundle-builds
+                "original_parent": None,
+                "operator_csv_modifications_url": csv_mod_url.format(build.id),
+            }
             build.bundle_pullspec_overrides = {
                 "pullspec_replacements": bundle["pullspec_replacements"],
                 "update": bundle["update"],
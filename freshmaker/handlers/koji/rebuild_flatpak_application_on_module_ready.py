@@ -22,7 +22,6 @@
 # Written by Valerij Maljulin <vmaljuli@redhat.com>
 # Written by Chuang Zhang <chuazhan@redhat.com>
 
-import json
 from collections import defaultdict
 
 import koji
@@ -349,19 +348,17 @@ class RebuildFlatpakApplicationOnModuleReady(ContainerBuildHandler):
                     original_odcs_compose_ids, module_name_stream_set
                 )
 
-                build.build_args = json.dumps(
-                    {
-                        "repository": image["repository"],
-                        "commit": image["commit"],
-                        "target": image["target"],
-                        "branch": image["git_branch"],
-                        "arches": image["arches"],
-                        "renewed_odcs_compose_ids": list(reused_composes),
-                        "flatpak": image.get("flatpak", False),
-                        "isolated": image.get("isolated", True),
-                        "original_parent": None,
-                    }
-                )
+                build.build_args = {
+                    "repository": image["repository"],
+                    "commit": image["commit"],
+                    "target": image["target"],
+                    "branch": image["git_branch"],
+                    "arches": image["arches"],
+                    "renewed_odcs_compose_ids": list(reused_composes),
+                    "flatpak": image.get("flatpak", False),
+                    "isolated": image.get("isolated", True),
+                    "original_parent": None,
+                }
                 db.session.commit()
 
                 compose_source = self._updated_compose_source(
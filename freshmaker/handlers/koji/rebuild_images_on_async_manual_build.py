@@ -20,7 +20,6 @@
 # SOFTWARE.
 
 import koji
-import json
 
 from freshmaker import conf, db, log
 from freshmaker.lightblue import LightBlue
@@ -369,7 +368,7 @@ class RebuildImagesOnAsyncManualBuild(ContainerBuildHandler):
                 build.transition(state, state_reason)
                 build_target = (
                     self.event.brew_target if self.event.brew_target else image["target"])
-                build.build_args = json.dumps({
+                build.build_args = {
                     "repository": image["repository"],
                     "commit": image["commit"],
                     "original_parent": parent_nvr,
@@ -378,7 +377,7 @@ class RebuildImagesOnAsyncManualBuild(ContainerBuildHandler):
                     "arches": image["arches"],
                     "flatpak": image.get("flatpak", False),
                     "isolated": image.get("isolated", True),
-                })
+                }
                 db.session.commit()
 
                 builds[nvr] = build
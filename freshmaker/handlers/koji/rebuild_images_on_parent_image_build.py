@@ -19,7 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import json
 from kobo import rpmlib
 
 from freshmaker import conf
@@ -108,11 +107,12 @@ class RebuildImagesOnParentImageBuild(ContainerBuildHandler):
             else:
                 found_build.transition(ArtifactBuildState.DONE.value, "Built successfully.")
         if event.new_state == 'FAILED':
-            args = json.loads(found_build.build_args)
+            # Copy the build args, so the change is detected by SQLAlchemy.
+            args = dict(found_build.build_args)
             if "retry_count" not in args:
                 args["retry_count"] = 0
             args["retry_count"] += 1
-            found_build.build_args = json.dumps(args)
+            found_build.build_args = args
             if args["retry_count"] < 3:
                 found_build.transition(
                     ArtifactBuildState.PLANNED.value,
@@ -22,7 +22,6 @@
 # Written by Chenxiong Qi <cqi@redhat.com>
 # Written by Jan Kaluza <jkaluza@redhat.com>
 
-import json
 import koji
 
 from freshmaker import conf, db
@@ -169,7 +168,7 @@ class RebuildImagesOnRPMAdvisoryChange(ContainerBuildHandler):
                 if (build.original_nvr not in printed and
                         ((build.dep_on and build.dep_on.original_nvr in printed) or
                          (not build.dep_on and batch == 0))):
-                    args = json.loads(build.build_args)
+                    args = build.build_args
                     if build.dep_on:
                         based_on = "based on %s" % build.dep_on.rebuilt_nvr
                     else:
@@ -294,7 +293,7 @@ class RebuildImagesOnRPMAdvisoryChange(ContainerBuildHandler):
 
                 build.transition(state, state_reason)
 
-                build.build_args = json.dumps({
+                build.build_args = {
                     "repository": image["repository"],
                     "commit": image["commit"],
                     "original_parent": parent_nvr,
@@ -304,7 +303,7 @@ class RebuildImagesOnRPMAdvisoryChange(ContainerBuildHandler):
                     "renewed_odcs_compose_ids": image["odcs_compose_ids"],
                     "flatpak": image.get("flatpak", False),
                     "isolated": image.get("isolated", True),
-                })
+                }
 
                 db.session.commit()
 
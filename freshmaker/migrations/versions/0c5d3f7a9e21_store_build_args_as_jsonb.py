@@ -0,0 +1,39 @@
+"""Store ArtifactBuild.build_args as JSONB on PostgreSQL
+
+Revision ID: 0c5d3f7a9e21
+Revises: c43f89ddca39
+Create Date: 2026-10-15 14:21:09.530117
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '0c5d3f7a9e21'
+down_revision = 'c43f89ddca39'
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+def upgrade():
+    # JSONB is PostgreSQL specific, other databases keep the generic JSON
+    # type.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column('artifact_builds', 'build_args',
+                    existing_type=sa.JSON(),
+                    type_=postgresql.JSONB(),
+                    existing_nullable=True,
+                    postgresql_using='build_args::jsonb')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column('artifact_builds', 'build_args',
+                    existing_type=postgresql.JSONB(),
+                    type_=sa.JSON(),
+                    existing_nullable=True,
+                    postgresql_using='build_args::json')
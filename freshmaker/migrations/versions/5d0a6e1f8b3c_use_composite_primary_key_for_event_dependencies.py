@@ -0,0 +1,45 @@
+"""Use composite primary key for EventDependency
+
+Revision ID: 5d0a6e1f8b3c
+Revises: 0c5d3f7a9e21
+Create Date: 2026-10-15 15:03:51.274460
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = '5d0a6e1f8b3c'
+down_revision = '0c5d3f7a9e21'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    # The unique index is superseded by the primary key.
+    op.drop_index('idx_event_dependency_rel', table_name='event_dependencies')
+    with op.batch_alter_table('event_dependencies') as batch_op:
+        batch_op.drop_column('id')
+        batch_op.create_primary_key(
+            'event_dependencies_pkey', ['event_id', 'event_dependency_id'])
+
+
+def downgrade():
+    # Recreate the table with the surrogate primary key and copy the rows,
+    # so the id column gets its sequence back.
+    with op.batch_alter_table('event_dependencies') as batch_op:
+        batch_op.drop_constraint('event_dependencies_pkey', type_='primary')
+    op.rename_table('event_dependencies', 'event_dependencies_old')
+    op.create_table('event_dependencies',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('event_dependency_id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['event_dependency_id'], ['events.id'], ),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(
+        'INSERT INTO event_dependencies (event_id, event_dependency_id) '
+        'SELECT event_id, event_dependency_id FROM event_dependencies_old')
+    op.drop_table('event_dependencies_old')
+    op.create_index('idx_event_dependency_rel', 'event_dependencies',
+                    ['event_id', 'event_dependency_id'], unique=True)
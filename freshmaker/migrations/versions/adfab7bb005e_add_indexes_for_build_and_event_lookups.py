@@ -0,0 +1,28 @@
+"""Add indexes for ArtifactBuild and Event lookups
+
+Revision ID: adfab7bb005e
+Revises: fcba8824bf8d
+Create Date: 2026-10-15 10:12:31.482019
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'adfab7bb005e'
+down_revision = 'fcba8824bf8d'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.create_index('idx_event_type_released', 'events', ['event_type_id', 'released'], unique=False)
+    op.create_index('idx_event_released', 'events', ['released'], unique=False)
+    op.create_index('idx_artifact_build_event_state', 'artifact_builds', ['event_id', 'state'], unique=False)
+    op.create_index('idx_artifact_build_dep_on_id', 'artifact_builds', ['dep_on_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_artifact_build_dep_on_id', table_name='artifact_builds')
+    op.drop_index('idx_artifact_build_event_state', table_name='artifact_builds')
+    op.drop_index('idx_event_released', table_name='events')
+    op.drop_index('idx_event_type_released', table_name='events')
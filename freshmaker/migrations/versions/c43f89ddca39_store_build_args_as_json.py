@@ -0,0 +1,32 @@
+"""Store ArtifactBuild.build_args as JSON
+
+Revision ID: c43f89ddca39
+Revises: adfab7bb005e
+Create Date: 2026-10-15 11:02:47.913604
+
+"""
+
+# revision identifiers, used by Alembic.
+revision = 'c43f89ddca39'
+down_revision = 'adfab7bb005e'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    with op.batch_alter_table('artifact_builds') as batch_op:
+        batch_op.alter_column('build_args',
+                              existing_type=sa.String(),
+                              type_=sa.JSON(),
+                              existing_nullable=True,
+                              postgresql_using='build_args::json')
+
+
+def downgrade():
+    with op.batch_alter_table('artifact_builds') as batch_op:
+        batch_op.alter_column('build_args',
+                              existing_type=sa.JSON(),
+                              type_=sa.String(),
+                              existing_nullable=True,
+                              postgresql_using='build_args::text')
@@ -27,8 +27,13 @@
 import json
 
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
-from sqlalchemy.orm import (validates, relationship)
+from sqlalchemy import insert, inspect, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import (validates, relationship, joinedload,
+                            selectinload, aliased)
 from sqlalchemy.schema import Index
 from sqlalchemy.sql.expression import false
 
@@ -36,7 +41,7 @@ from flask_login import UserMixin
 
 from freshmaker import db, log
 from freshmaker import messaging
-from freshmaker.utils import get_url_for
+from freshmaker.utils import get_url_for, get_urls_for
 from freshmaker.types import (ArtifactType, ArtifactBuildState, EventState,
                               RebuildReason)
 from freshmaker.events import (
@@ -76,6 +81,22 @@ EVENT_TYPES = {
 
 INVERSE_EVENT_TYPES = {v: k for k, v in EVENT_TYPES.items()}
 
+# Member values and lower-case member names of the enums stored in the
+# database, used to validate the values of the corresponding columns.
+_ENUM_LOOKUPS = {
+    enum_cls: (
+        frozenset(member.value for member in enum_cls),
+        {member.name.lower(): member.value for member in enum_cls},
+    )
+    for enum_cls in (EventState, ArtifactBuildState, ArtifactType)
+}
+
+# Names of the enum members by their values, used when serializing the
+# models to avoid constructing the enum members.
+_EVENT_STATE_NAMES = {s.value: s.name for s in EventState}
+_BUILD_STATE_NAMES = {s.value: s.name for s in ArtifactBuildState}
+_ARTIFACT_TYPE_NAMES = {t.value: t.name for t in ArtifactType}
+
 
 def _utc_datetime_to_iso(datetime_object):
     """
@@ -90,19 +111,76 @@ def _utc_datetime_to_iso(datetime_object):
     return None
 
 
+def _enum_value(enum_cls, key, field):
+    """
+    Converts the `field` to the value of a member of `enum_cls`.
+
+    :param enum_cls: Enum class the field belongs to.
+    :param str key: name of the validated column, used in the error message.
+    :param field: member value, lower-case member name or the member itself.
+    :return: int value of the enum member.
+    :raises ValueError: if `field` does not represent any member of `enum_cls`.
+    """
+    values, names = _ENUM_LOOKUPS[enum_cls]
+    if field in values:
+        return field
+    if field in names:
+        return names[field]
+    if isinstance(field, enum_cls):
+        return field.value
+    raise ValueError("%s: %s, not in %r" % (key, field, list(enum_cls)))
+
+
+def _reattach(obj):
+    """
+    Adds the detached `obj` back to the db session.
+
+    This is needed when get_url_for() had to create a temporary app_context,
+    because its teardown removes the current db session. Objects which are
+    still attached are left untouched to avoid cascading the add through all
+    their loaded relationships.
+    """
+    if inspect(obj).detached:
+        db.session.add(obj)
+
+
+@contextmanager
+def transactional():
+    """
+    Ensures db session is committed when the outermost `transactional()` block
+    exits successfully, otherwise rollback.
+
+    Nested blocks run in a savepoint instead, so a caller can group multiple
+    operations (for example calls of functions decorated by
+    `commit_on_success`) into a single transaction. A failing nested block
+    rolls back only its own changes.
+    """
+    depth = db.session.info.get("transactional_depth", 0)
+    db.session.info["transactional_depth"] = depth + 1
+    try:
+        if depth == 0:
+            try:
+                yield db.session
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+        else:
+            with db.session.begin_nested():
+                yield db.session
+    finally:
+        db.session.info["transactional_depth"] = depth
+
+
 def commit_on_success(func):
     """
     Ensures db session is committed after a successful call to decorated
-    function, otherwise rollback.
+    function, otherwise rollback. When called inside a `transactional()`
+    block, the commit is left to the outermost block.
     """
     def _decorator(*args, **kwargs):
-        try:
+        with transactional():
             return func(*args, **kwargs)
-        except Exception:
-            db.session.rollback()
-            raise
-        finally:
-            db.session.commit()
     return _decorator
 
 
@@ -157,10 +235,11 @@ class Event(FreshmakerBase):
     state_reason = db.Column(db.String, nullable=True)
     time_created = db.Column(db.DateTime, nullable=True)
     time_done = db.Column(db.DateTime, nullable=True)
-    # AppenderQuery for getting builds associated with this Event.
+    # AppenderQuery for getting builds associated with this Event, ordered
+    # by the time they have been recorded.
     builds = relationship("ArtifactBuild", back_populates="event",
                           lazy="dynamic", cascade="all, delete-orphan",
-                          passive_deletes=True)
+                          passive_deletes=True, order_by="ArtifactBuild.id")
     # True if the even should be handled in dry run mode.
     dry_run = db.Column(db.Boolean, default=False)
     # For manual rebuilds, set to user requesting the rebuild. Otherwise null.
@@ -178,12 +257,19 @@ class Event(FreshmakerBase):
         default=False,
         doc='Whether this event is triggered manually')
 
+    # Events this Event depends on. The Events depending on this Event are
+    # available as `dependents`.
+    dependencies = relationship(
+        "Event", secondary="event_dependencies",
+        primaryjoin="Event.id == event_dependencies.c.event_id",
+        secondaryjoin="Event.id == event_dependencies.c.event_dependency_id",
+        backref="dependents")
+
     @classmethod
     def create(cls, session, message_id, search_key, event_type, released=True,
                state=None, manual=False, dry_run=False, requester=None,
                requested_rebuilds=None, requester_metadata=None):
-        if event_type in EVENT_TYPES:
-            event_type = EVENT_TYPES[event_type]
+        event_type = EVENT_TYPES.get(event_type, event_type)
         now = datetime.utcnow()
         event = cls(
             message_id=message_id,
@@ -203,17 +289,12 @@ class Event(FreshmakerBase):
 
     @validates('state')
     def validate_state(self, key, field):
-        if field in [s.value for s in list(EventState)]:
-            return field
-        if field in [s.name.lower() for s in list(EventState)]:
-            return EventState[field.upper()].value
-        if isinstance(field, EventState):
-            return field.value
-        raise ValueError("%s: %s, not in %r" % (key, field, list(EventState)))
+        return _enum_value(EventState, key, field)
 
     @classmethod
     def get(cls, session, message_id):
-        return session.query(cls).filter_by(message_id=message_id).first()
+        return session.query(cls).filter(
+            cls.message_id == message_id).one_or_none()
 
     @classmethod
     def get_or_create(cls, session, message_id, search_key, event_type,
@@ -285,7 +366,7 @@ class Event(FreshmakerBase):
 
     @classmethod
     def get_by_event_id(cls, session, event_id):
-        return session.query(cls).filter_by(id=event_id).first()
+        return session.get(cls, event_id)
 
     def get_image_builds_in_first_batch(self, session):
         return session.query(ArtifactBuild).filter_by(
@@ -304,50 +385,85 @@ class Event(FreshmakerBase):
         :param session: the `db.session`.
         :param event: the dependent event to be added.
         :type event: :py:class:`Event`
-        :return: instance of :py:class:`EventDependency`. Caller is responsible
-            for committing changes to database. If `event` has been added
-            already, nothing changed and `None` will be returned.
-        """
-        dep = session.query(EventDependency.id).filter_by(
-            event_id=self.id, event_dependency_id=event.id).first()
-        if dep is None:
-            dep = EventDependency(event_id=self.id,
-                                  event_dependency_id=event.id)
-            session.add(dep)
-            return dep
-        else:
+        :return: the added `event`. Caller is responsible for committing
+            changes to database. If `event` has been added already, nothing
+            changed and `None` will be returned.
+        """
+        if event in self.dependencies:
             return None
+        self.dependencies.append(event)
+        return event
+
+    def add_event_dependencies(self, session, events):
+        """
+        Adds multiple dependent events using a single INSERT. Dependencies
+        which have been added already are skipped.
+
+        :param session: the `db.session`.
+        :param events: the dependent events to be added.
+        :type events: list of :py:class:`Event`
+        """
+        dep_event_ids = {event.id for event in events}
+        if session.connection().dialect.name == "postgresql":
+            stmt = postgresql_insert(EventDependency).on_conflict_do_nothing()
+        else:
+            dep_event_ids -= {event.id for event in self.dependencies}
+            stmt = insert(EventDependency)
+        if not dep_event_ids:
+            return
+        session.execute(stmt.values([
+            {"event_id": self.id, "event_dependency_id": dep_event_id}
+            for dep_event_id in sorted(dep_event_ids)
+        ]))
+        # The relationship collections do not know about the inserted rows.
+        session.expire(self, ["dependencies"])
+        for event in events:
+            session.expire(event, ["dependents"])
 
     @property
     def event_dependencies(self):
         """
         Returns the list of Events this Event depends on.
         """
-        events = []
-        deps = EventDependency.query.filter_by(event_id=self.id).all()
-        for dep in deps:
-            events.append(Event.query.filter_by(
-                id=dep.event_dependency_id).first())
-        return events
+        return list(self.dependencies)
 
     @property
     def depending_events(self):
         """
         Returns the list of Events depending on this Event.
         """
-        depending_events = []
-        parents = EventDependency.query.filter_by(event_dependency_id=self.id).all()
-        for p in parents:
-            depending_events.append(Event.query.filter_by(
-                id=p.event_id).first())
-        return depending_events
+        return list(self.dependents)
+
+    def _has_any_build(self, *criteria):
+        """
+        Returns True when at least one build of this event matches all the
+        `criteria`. The database stops looking after the first match.
+        """
+        query = db.session.query(ArtifactBuild).filter(
+            ArtifactBuild.event_id == self.id, *criteria)
+        return db.session.query(query.exists()).scalar()
 
     def has_all_builds_in_state(self, state):
         """
         Returns True when all builds are in the given `state`.
         """
-        return db.session.query(ArtifactBuild).filter_by(
-            event_id=self.id).filter(state != state).count() == 0
+        return not self._has_any_build(ArtifactBuild.state != state)
+
+    def has_any_failed_build(self):
+        """
+        Returns True when at least one build is in the FAILED state.
+        """
+        return self._has_any_build(
+            ArtifactBuild.state == ArtifactBuildState.FAILED.value)
+
+    def has_any_active_build(self):
+        """
+        Returns True when at least one build is planned or still building.
+        """
+        return self._has_any_build(ArtifactBuild.state.in_([
+            ArtifactBuildState.PLANNED.value,
+            ArtifactBuildState.BUILD.value,
+        ]))
 
     def builds_transition(self, state, reason, filters=None):
         """
@@ -382,17 +498,17 @@ class Event(FreshmakerBase):
         if state_reason is not None:
             self.state_reason = state_reason
 
+        # In case Event is already in the state, return False.
+        if self.state == state:
+            return False
+
         # Log the state and state_reason
         if state == EventState.FAILED.value:
             log_fnc = log.error
         else:
             log_fnc = log.info
-        log_fnc("Event %r moved to state %s, %r" % (
-            self, EventState(state).name, state_reason))
-
-        # In case Event is already in the state, return False.
-        if self.state == state:
-            return False
+        log_fnc("Event %r moved to state %s, %r",
+                self, _EVENT_STATE_NAMES[state], state_reason)
 
         self.state = state
 
@@ -428,14 +544,14 @@ class Event(FreshmakerBase):
 
     def json(self):
         data = self._common_json()
-        data['builds'] = [b.json() for b in self.builds]
+        data['builds'] = ArtifactBuild.list_json(db.session, self.id)
         return data
 
     def json_min(self):
         builds_summary = defaultdict(int)
         builds_summary['total'] = len(self.builds.all())
         for build in self.builds:
-            state_name = ArtifactBuildState(build.state).name
+            state_name = _BUILD_STATE_NAMES[build.state]
             builds_summary[state_name] += 1
 
         data = self._common_json()
@@ -444,14 +560,14 @@ class Event(FreshmakerBase):
 
     def _common_json(self):
         event_url = get_url_for('event', id=self.id)
-        db.session.add(self)
+        _reattach(self)
         return {
             "id": self.id,
             "message_id": self.message_id,
             "search_key": self.search_key,
             "event_type_id": self.event_type_id,
             "state": self.state,
-            "state_name": EventState(self.state).name,
+            "state_name": _EVENT_STATE_NAMES[self.state],
             "state_reason": self.state_reason,
             "time_created": _utc_datetime_to_iso(self.time_created),
             "time_done": _utc_datetime_to_iso(self.time_done),
@@ -490,12 +606,9 @@ class Event(FreshmakerBase):
             Event.state.in_(states),
         ).distinct()
 
-        dep_events = []
-        query = db.session.query(Event)
-        for row in dep_event_ids:
-            dep_event = query.filter_by(id=row[0]).first()
-            self.add_event_dependency(db.session, dep_event)
-            dep_events.append(dep_event)
+        dep_events = db.session.query(Event).filter(
+            Event.id.in_(dep_event_ids)).all()
+        self.add_event_dependencies(db.session, dep_events)
         db.session.commit()
         return dep_events
 
@@ -516,20 +629,14 @@ class Event(FreshmakerBase):
 
 
 Index('idx_event_message_id', Event.message_id, unique=True)
+Index('idx_event_type_released', Event.event_type_id, Event.released)
+Index('idx_event_released', Event.released)
 
 
 class EventDependency(FreshmakerBase):
     __tablename__ = "event_dependencies"
-    id = db.Column(db.Integer, primary_key=True)
-    event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
-    event_dependency_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
-
-
-Index(
-    'idx_event_dependency_rel',
-    EventDependency.event_id,
-    EventDependency.event_dependency_id,
-    unique=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id'), primary_key=True)
+    event_dependency_id = db.Column(db.Integer, db.ForeignKey('events.id'), primary_key=True)
 
 
 class ArtifactBuild(FreshmakerBase):
@@ -561,8 +668,9 @@ class ArtifactBuild(FreshmakerBase):
     # reason.
     build_id = db.Column(db.Integer)
 
-    # Build args in json format.
-    build_args = db.Column(db.String, nullable=True)
+    # Build args as a JSON object, stored as JSONB on PostgreSQL.
+    build_args = db.Column(
+        db.JSON().with_variant(JSONB(), 'postgresql'), nullable=True)
 
     # The reason why this artifact is rebuilt. Set according to
     # `freshmaker.types.RebuildReason`.
@@ -579,9 +687,16 @@ class ArtifactBuild(FreshmakerBase):
     def create(cls, session, event, name, type,
                build_id=None, dep_on=None, state=None,
                original_nvr=None, rebuilt_nvr=None,
-               rebuild_reason=0):
+               rebuild_reason=0, now=None):
+        """
+        Creates new artifact build of the `event` and adds it to the session.
 
-        now = datetime.utcnow()
+        :param now: time the build has been submitted. Callers creating
+            multiple builds at once can pass the same time to all of them.
+            Defaults to the current UTC time.
+        :return: the created :py:class:`ArtifactBuild`.
+        """
+        now = now or datetime.utcnow()
         build = cls(
             name=name,
             original_nvr=original_nvr,
@@ -597,25 +712,50 @@ class ArtifactBuild(FreshmakerBase):
         session.add(build)
         return build
 
+    @classmethod
+    def create_many(cls, session, event, builds, now=None):
+        """
+        Creates multiple artifact builds of the `event` using a single bulk
+        INSERT.
+
+        The builds are not added to the session as ORM objects, so this is
+        meant for callers which do not need the created instances.
+
+        :param session: the `db.session`.
+        :param event: the :py:class:`Event` the builds belong to.
+        :param list builds: list of dicts with the keyword arguments accepted
+            by :py:meth:`create`, except `event` and `dep_on`, which can be
+            replaced by `dep_on_id`.
+        :param now: time all the builds have been submitted. Defaults to the
+            current UTC time.
+        """
+        now = now or datetime.utcnow()
+        rows = []
+        for build in builds:
+            row = {
+                "original_nvr": None,
+                "rebuilt_nvr": None,
+                "build_id": None,
+                "dep_on_id": None,
+                "rebuild_reason": 0,
+            }
+            row.update(build)
+            row["type"] = _enum_value(ArtifactType, "type", row["type"])
+            row["state"] = _enum_value(
+                ArtifactBuildState, "state",
+                row.get("state") or ArtifactBuildState.BUILD.value)
+            row["event_id"] = event.id
+            row["time_submitted"] = now
+            rows.append(row)
+        session.bulk_insert_mappings(cls, rows)
+
     @validates('state')
     def validate_state(self, key, field):
-        if field in [s.value for s in list(ArtifactBuildState)]:
-            return field
-        if field in [s.name.lower() for s in list(ArtifactBuildState)]:
-            return ArtifactBuildState[field.upper()].value
-        if isinstance(field, ArtifactBuildState):
-            return field.value
-        raise ValueError("%s: %s, not in %r" % (key, field, list(ArtifactBuildState)))
+        return _enum_value(ArtifactBuildState, key, field)
 
     @validates('type')
     def validate_type(self, key, field):
-        if field in [t.value for t in list(ArtifactType)]:
-            return field
-        if field in [t.name.lower() for t in list(ArtifactType)]:
-            return ArtifactType[field.upper()].value
-        if isinstance(field, ArtifactType):
-            return field.value
-        raise ValueError("%s: %s, not in %r" % (key, field, list(ArtifactType)))
+        return _enum_value(ArtifactType, key, field)
 
     @classmethod
     def get_lowest_build_id(cls, session):
@@ -657,7 +797,28 @@ class ArtifactBuild(FreshmakerBase):
         """
         Returns list of artifact builds depending on this one.
         """
-        return ArtifactBuild.query.filter_by(dep_on_id=self.id).all()
+        return ArtifactBuild.depending_on_many(db.session, [self.id])[self.id]
+
+    @classmethod
+    def depending_on_many(cls, session, ids):
+        """
+        Returns artifact builds depending on any of the artifact builds with
+        the given `ids` using a single query.
+
+        :param session: SQLAlchemy session.
+        :param list ids: ids of the artifact builds.
+        :return: dict mapping an id from `ids` to the list of artifact
+            builds depending on it. Ids without depending builds map to
+            an empty list.
+        """
+        depending = defaultdict(list)
+        if not ids:
+            return depending
+        builds = session.query(cls).filter(
+            cls.dep_on_id.in_(ids)).order_by(cls.id)
+        for build in builds:
+            depending[build.dep_on_id].append(build)
+        return depending
 
     def transition(self, state, state_reason):
         """
@@ -670,16 +831,17 @@ class ArtifactBuild(FreshmakerBase):
         # Convert state from its possible representation to number.
         state = self.validate_state("state", state)
 
+        # Builders re-poll the build status, so this is often a no-op.
+        if self.state == state:
+            return False
+
         # Log the state and state_reason
         if state == ArtifactBuildState.FAILED.value:
             log_fnc = log.error
         else:
             log_fnc = log.info
-        log_fnc("Artifact build %r moved to state %s, %r" % (
-            self, ArtifactBuildState(state).name, state_reason))
-
-        if self.state == state:
-            return False
+        log_fnc("Artifact build %r moved to state %s, %r",
+                self, _BUILD_STATE_NAMES[state], state_reason)
 
         self.state = state
         if ArtifactBuildState(state).counter:
@@ -696,58 +858,200 @@ class ArtifactBuild(FreshmakerBase):
         # can rebuild them.
         if self.state in [ArtifactBuildState.FAILED.value,
                           ArtifactBuildState.CANCELED.value]:
-            for build in self.depending_artifact_builds():
-                build.transition(
-                    self.state, "Cannot build artifact, because its "
-                    "dependency cannot be built.")
+            self._transition_depending_artifact_builds(
+                "Cannot build artifact, because its dependency cannot be "
+                "built.")
 
         messaging.publish('build.state.changed', self.json())
 
         return True
 
+    def _transition_depending_artifact_builds(self, state_reason):
+        """
+        Moves all the artifact builds depending directly or indirectly on
+        this one to the state of this build.
+
+        The whole dependency subtree is found using a single recursive query
+        and updated using a single UPDATE statement. Builds which are already
+        in the target state are skipped together with their own dependencies.
+
+        :param state_reason: Reason why the state has been set.
+        :return: list of transitioned artifact builds.
+        """
+        subtree = db.session.query(ArtifactBuild.id).filter(
+            ArtifactBuild.dep_on_id == self.id,
+            ArtifactBuild.state != self.state,
+        ).cte(name="subtree", recursive=True)
+        subtree = subtree.union_all(
+            db.session.query(ArtifactBuild.id).join(
+                subtree, ArtifactBuild.dep_on_id == subtree.c.id
+            ).filter(ArtifactBuild.state != self.state)
+        )
+        build_ids = [row.id for row in db.session.query(subtree.c.id)]
+        if not build_ids:
+            return []
+
+        db.session.query(ArtifactBuild).filter(
+            ArtifactBuild.id.in_(build_ids)
+        ).update({
+            ArtifactBuild.state: self.state,
+            ArtifactBuild.state_reason: state_reason,
+            ArtifactBuild.time_completed: self.time_completed,
+        }, synchronize_session="evaluate")
+
+        builds = ArtifactBuild.query.filter(
+            ArtifactBuild.id.in_(build_ids)).all()
+        if self.state == ArtifactBuildState.FAILED.value:
+            log_fnc = log.error
+        else:
+            log_fnc = log.info
+        counter = ArtifactBuildState(self.state).counter
+        for build in builds:
+            log_fnc("Artifact build %r moved to state %s, %r",
+                    build, _BUILD_STATE_NAMES[self.state], state_reason)
+            if counter:
+                counter.inc()
+            messaging.publish('build.state.changed', build.json())
+
+        return builds
+
     def __repr__(self):
         return "<ArtifactBuild %s, type %s, state %s, event %s>" % (
-            self.name, ArtifactType(self.type).name,
-            ArtifactBuildState(self.state).name, self.event.message_id)
+            self.name, _ARTIFACT_TYPE_NAMES[self.type],
+            _BUILD_STATE_NAMES[self.state], self.event.message_id)
 
-    def json(self):
-        build_args = {}
-        if self.build_args:
-            build_args = json.loads(self.build_args)
+    @classmethod
+    def json_load_options(cls):
+        """
+        Returns the loader options eagerly loading the relationships used by
+        :py:meth:`json`, so serializing many builds does not issue additional
+        queries for each of them.
+        """
+        return (
+            joinedload(cls.dep_on),
+            selectinload(cls.composes).joinedload(ArtifactBuildCompose.compose),
+        )
 
+    def json(self):
         build_url = get_url_for('build', id=self.id)
-        db.session.add(self)
+        _reattach(self)
+        return self._json_from_row(
+            self,
+            dep_on=self.dep_on.name if self.dep_on else None,
+            odcs_composes=[rel.compose.odcs_compose_id for rel in self.composes],
+            url=build_url)
+
+    @staticmethod
+    def _json_from_row(row, dep_on, odcs_composes, url):
+        """
+        Returns the JSON representation of an artifact build.
+
+        :param row: :py:class:`ArtifactBuild` or a database row with the
+            same column attributes.
+        :param str dep_on: name of the build this one depends on, or None.
+        :param list odcs_composes: ids of ODCS composes used by the build.
+        :param str url: URL of the build in the API.
+        :return: dict.
+        """
         return {
-            "id": self.id,
-            "name": self.name,
-            "original_nvr": self.original_nvr,
-            "rebuilt_nvr": self.rebuilt_nvr,
-            "type": self.type,
-            "type_name": ArtifactType(self.type).name,
-            "state": self.state,
-            "state_name": ArtifactBuildState(self.state).name,
-            "state_reason": self.state_reason,
-            "dep_on": self.dep_on.name if self.dep_on else None,
-            "dep_on_id": self.dep_on.id if self.dep_on else None,
-            "time_submitted": _utc_datetime_to_iso(self.time_submitted),
-            "time_completed": _utc_datetime_to_iso(self.time_completed),
-            "event_id": self.event_id,
-            "build_id": self.build_id,
-            "url": build_url,
-            "build_args": build_args,
-            "odcs_composes": [rel.compose.odcs_compose_id for rel in self.composes],
-            "rebuild_reason": RebuildReason(self.rebuild_reason or 0).name.lower()
+            "id": row.id,
+            "name": row.name,
+            "original_nvr": row.original_nvr,
+            "rebuilt_nvr": row.rebuilt_nvr,
+            "type": row.type,
+            "type_name": _ARTIFACT_TYPE_NAMES[row.type],
+            "state": row.state,
+            "state_name": _BUILD_STATE_NAMES[row.state],
+            "state_reason": row.state_reason,
+            "dep_on": dep_on,
+            "dep_on_id": row.dep_on_id,
+            "time_submitted": _utc_datetime_to_iso(row.time_submitted),
+            "time_completed": _utc_datetime_to_iso(row.time_completed),
+            "event_id": row.event_id,
+            "build_id": row.build_id,
+            "url": url,
+            "build_args": row.build_args or {},
+            "odcs_composes": odcs_composes,
+            "rebuild_reason": RebuildReason(row.rebuild_reason or 0).name.lower()
         }
 
+    @classmethod
+    def list_json(cls, session, event_id):
+        """
+        Returns the JSON representation of all artifact builds of the event
+        with id `event_id`, as returned by :py:meth:`json`, ordered by id.
+
+        The builds are read as plain rows, without loading them into the
+        ORM session. One query selects the builds together with the names
+        of builds they depend on, another one the ODCS composes they use.
+
+        :param session: SQLAlchemy session.
+        :param int event_id: id of the event.
+        :return: list of dicts.
+        """
+        dep_on = aliased(cls)
+        stmt = select(
+            cls.id, cls.name, cls.original_nvr, cls.rebuilt_nvr, cls.type,
+            cls.state, cls.state_reason, dep_on.name.label("dep_on"),
+            cls.dep_on_id, cls.time_submitted, cls.time_completed,
+            cls.event_id, cls.build_id, cls.build_args, cls.rebuild_reason,
+        ).outerjoin(
+            dep_on, cls.dep_on_id == dep_on.id
+        ).where(
+            cls.event_id == event_id
+        ).order_by(cls.id)
+        # Selecting the mapped attributes rather than the table columns makes
+        # this an ORM statement, so pending changes are flushed first.
+        rows = session.execute(stmt).all()
+
+        odcs_composes = defaultdict(list)
+        if rows:
+            stmt = select(
+                ArtifactBuildCompose.build_id, Compose.odcs_compose_id
+            ).join(
+                Compose, ArtifactBuildCompose.compose_id == Compose.id
+            ).join(
+                cls, ArtifactBuildCompose.build_id == cls.id
+            ).where(cls.event_id == event_id)
+            for build_id, odcs_compose_id in session.execute(stmt):
+                odcs_composes[build_id].append(odcs_compose_id)
+
+        urls = get_urls_for('build', [{"id": row.id} for row in rows])
+        return [
+            cls._json_from_row(
+                row,
+                dep_on=row.dep_on,
+                odcs_composes=odcs_composes[row.id],
+                url=url)
+            for row, url in zip(rows, urls)
+        ]
+
     def get_root_dep_on(self):
-        dep_on = self.dep_on
-        while dep_on:
-            dep = dep_on.dep_on
-            if dep:
-                dep_on = dep
-            else:
-                break
-        return dep_on
+        """
+        Returns the artifact build at the root of the chain of artifact builds
+        this one depends on, or None if this build does not depend on any
+        other build. The whole chain is resolved using a single recursive
+        query.
+        """
+        if self.dep_on_id is None:
+            if self.dep_on is None:
+                return None
+            # The dep_on has been set, but not flushed to the database yet.
+            db.session.flush()
+
+        chain = db.session.query(
+            ArtifactBuild.id, ArtifactBuild.dep_on_id
+        ).filter(
+            ArtifactBuild.id == self.dep_on_id
+        ).cte(name="chain", recursive=True)
+        chain = chain.union_all(
+            db.session.query(
+                ArtifactBuild.id, ArtifactBuild.dep_on_id
+            ).join(chain, ArtifactBuild.id == chain.c.dep_on_id)
+        )
+        return db.session.query(ArtifactBuild).join(
+            chain, ArtifactBuild.id == chain.c.id
+        ).filter(chain.c.dep_on_id.is_(None)).one_or_none()
 
     def add_composes(self, session, composes):
         """Add an ODCS compose to this build"""
@@ -774,6 +1078,10 @@ class ArtifactBuild(FreshmakerBase):
         return list({b.original_nvr for b in builds.all()})
 
 
+Index('idx_artifact_build_event_state', ArtifactBuild.event_id, ArtifactBuild.state)
+Index('idx_artifact_build_dep_on_id', ArtifactBuild.dep_on_id)
+
+
 class Compose(FreshmakerBase):
     __tablename__ = 'composes'
 
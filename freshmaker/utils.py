@@ -20,6 +20,7 @@
 # SOFTWARE.
 #
 
+import contextlib
 import functools
 import requests
 import semver
@@ -74,12 +75,15 @@ def sorted_by_nvr(lst, get_nvr=None, reverse=False):
         lst, key=functools.cmp_to_key(_compare_items), reverse=reverse)
 
 
-def get_url_for(*args, **kwargs):
+@contextlib.contextmanager
+def _url_app_context():
     """
-    flask.url_for wrapper which creates the app_context on-the-fly.
+    Ensures there is a Flask app_context to generate URLs in, creating it
+    on-the-fly if needed.
     """
     if has_app_context():
-        return url_for(*args, **kwargs)
+        yield
+        return
 
     # Localhost is right URL only when the scheduler runs on the same
     # system as the web views.
@@ -88,9 +92,27 @@ def get_url_for(*args, **kwargs):
         log.warning("get_url_for() has been called without the Flask "
                     "app_context. That can lead to SQLAlchemy errors caused by "
                     "multiple session being used in the same time.")
+        yield
+
+
+def get_url_for(*args, **kwargs):
+    """
+    flask.url_for wrapper which creates the app_context on-the-fly.
+    """
+    with _url_app_context():
         return url_for(*args, **kwargs)
 
 
+def get_urls_for(endpoint, values_list):
+    """
+    Returns the URLs of `endpoint` generated by flask.url_for for each of the
+    dicts of URL values in `values_list`. Unlike calling `get_url_for` for
+    each of them, at most one app_context is created on-the-fly.
+    """
+    with _url_app_context():
+        return [url_for(endpoint, **values) for values in values_list]
+
+
 def get_rebuilt_nvr(artifact_type, nvr):
     """
     Returns the new NVR of artifact which should be used when rebuilding
@@ -285,7 +285,7 @@ class EventAPI(MethodView):
             return jsonify(json_data), 200
 
         else:
-            event = models.Event.query.filter_by(id=id).first()
+            event = db.session.get(models.Event, id)
             if event:
                 if not show_full_json:
                     return jsonify(event.json_min()), 200
@@ -328,7 +328,7 @@ class EventAPI(MethodView):
         if data["action"] != "cancel":
             return json_error(400, "Bad Request", "Unsupported action requested.")
 
-        event = models.Event.query.filter_by(id=id).first()
+        event = db.session.get(models.Event, id)
         if not event:
             return json_error(400, "Not Found", "No such event found.")
 
@@ -449,7 +449,7 @@ class BuildAPI(MethodView):
             return jsonify(json_data), 200
 
         else:
-            build = models.ArtifactBuild.query.filter_by(id=id).first()
+            build = db.session.get(models.ArtifactBuild, id)
             if build:
                 return jsonify(build.json()), 200
             else:
@@ -782,7 +782,7 @@ class VerifyImageRepositoryAPI(MethodView):
 class PullspecOverrideAPI(MethodView):
     @freshmaker_build_api_latency.time()
     def get(self, id):
-        build = models.ArtifactBuild.query.filter_by(id=id).first()
+        build = db.session.get(models.ArtifactBuild, id)
         if build:
             pullspec_overrides = build.bundle_pullspec_overrides
             return jsonify(pullspec_overrides), 200
@@ -18,7 +18,6 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
-import json
 from datetime import datetime
 from unittest.mock import patch, call, MagicMock
 
@@ -999,9 +998,9 @@ class TestBotasShippedAdvisory(helpers.ModelsTestCase):
             "original_parent": None,
             "operator_csv_modifications_url": "https://localhost/api/2/pullspec_overrides/1",
         }
-        self.assertEqual(json.loads(submitted_build.build_args), expected_build_args)
+        self.assertEqual(submitted_build.build_args, expected_build_args)
         self.assertEqual(submitted_build.state, ArtifactBuildState.PLANNED.value)
-        self.assertEqual(json.loads(submitted_build.build_args)["operator_csv_modifications_url"],
+        self.assertEqual(submitted_build.build_args["operator_csv_modifications_url"],
                          pullspec_override_url + str(submitted_build.id))
 
 
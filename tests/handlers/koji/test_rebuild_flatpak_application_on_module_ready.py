@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: MIT
 
-import json
 from unittest.mock import patch
 
 from freshmaker import db
@@ -355,7 +354,7 @@ class TestFlatpakModuleAdvisoryReadyEvent(helpers.ModelsTestCase):
         # Check that the images have proper data in proper db columns.
         e = db.session.query(Event).filter(Event.id == 1).one()
         for build in e.builds:
-            args = json.loads(build.build_args)
+            args = build.build_args
             self.assertEqual(args["repository"], build.name + "_repo")
             self.assertEqual(args["commit"], build.name + "_123")
             self.assertEqual(args["renewed_odcs_compose_ids"], [10, 11])
@@ -19,7 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import json
 import unittest
 
 from unittest import mock
@@ -102,7 +101,7 @@ class TestRebuildImagesOnParentImageBuild(helpers.ModelsTestCase):
         base_build = models.ArtifactBuild.create(
             db.session, e1, 'test-product-docker', ArtifactType.IMAGE, event.task_id,
             original_nvr='foo-1-1')
-        base_build.build_args = json.dumps({})
+        base_build.build_args = {}
 
         models.ArtifactBuild.create(db.session, e1, 'docker-up', ArtifactType.IMAGE, 0,
                                     dep_on=base_build, state=ArtifactBuildState.PLANNED)
@@ -310,7 +309,7 @@ class TestRebuildImagesOnParentImageBuild(helpers.ModelsTestCase):
             state=ArtifactBuildState.PLANNED.value,
             original_nvr='image-a-0.1-1', rebuilt_nvr='image-a-0.1-2')
         # Empty json.
-        self.image_a_build.build_args = "{}"
+        self.image_a_build.build_args = {}
 
         db.session.commit()
 
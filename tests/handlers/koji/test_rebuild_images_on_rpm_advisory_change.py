@@ -19,7 +19,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import json
 from unittest.mock import patch, PropertyMock, Mock, call
 
 import freshmaker
@@ -908,7 +907,7 @@ class TestBatches(helpers.ModelsTestCase):
             else:
                 self.assertEqual(build.rebuild_reason, RebuildReason.DEPENDENCY.value)
 
-            args = json.loads(build.build_args)
+            args = build.build_args
             self.assertEqual(args["repository"], build.name + "_repo")
             self.assertEqual(args["commit"], build.name + "_123")
             self.assertEqual(args["original_parent"],
@@ -923,7 +922,7 @@ class TestCheckImagesToRebuild(helpers.ModelsTestCase):
     def setUp(self):
         super(TestCheckImagesToRebuild, self).setUp()
 
-        build_args = json.dumps({
+        build_args = {
             "original_parent": "nvr",
             "repository": "repo",
             "target": "target",
@@ -932,7 +931,7 @@ class TestCheckImagesToRebuild(helpers.ModelsTestCase):
             "yum_repourl": "http://localhost/composes/latest-odcs-3-1/compose/"
                            "Temporary/odcs-3.repo",
             "odcs_pulp_compose_id": 15,
-        })
+        }
 
         self.ev = Event.create(db.session, 'msg-id', '123',
                                EVENT_TYPES[ErrataAdvisoryRPMsSignedEvent])
@@ -151,6 +151,37 @@ class ConsumerTest(helpers.ConsumerBaseTest):
             self.assertEqual(build.state, ArtifactBuildState.FAILED.value)
             self.assertTrue(build.state_reason, "Failed with traceback")
 
+    @mock.patch("freshmaker.handlers.internal.UpdateDBOnODCSComposeFail.can_handle")
+    @mock.patch("freshmaker.handlers.internal.UpdateDBOnODCSComposeFail.handle")
+    @mock.patch("freshmaker.consumer.get_global_consumer")
+    def test_consumer_rollback_uncommitted_changes_on_exception(
+            self, global_consumer, handle, handler_can_handle):
+        """
+        Tests that Consumer.consume commits changes left by a successful
+        handler and rolls back changes left by a failing one.
+        """
+        consumer = self.create_consumer()
+        global_consumer.return_value = consumer
+
+        handler_can_handle.return_value = True
+
+        def mocked_handle(msg):
+            Event.create(db.session, "msg_id_1", "msg_id_1", 0)
+
+        handle.side_effect = mocked_handle
+        consumer.consume(self._compose_state_change_msg())
+
+        def mocked_handle(msg):
+            Event.create(db.session, "msg_id_2", "msg_id_2", 0)
+            raise ValueError("Expected exception")
+
+        handle.side_effect = mocked_handle
+        consumer.consume(self._compose_state_change_msg())
+
+        db.session.rollback()
+        self.assertIsNotNone(Event.get(db.session, "msg_id_1"))
+        self.assertIsNone(Event.get(db.session, "msg_id_2"))
+
 
 class ParseBrewSignRPMEventTest(helpers.ModelsTestCase):
 
@@ -22,7 +22,6 @@
 #
 # Written by Chenxiong Qi <cqi@redhat.com>
 
-import json
 
 from unittest.mock import patch
 from requests.exceptions import HTTPError
@@ -128,13 +127,13 @@ class TestGetRepoURLs(helpers.ModelsTestCase):
             db.session, self.event, 'build-1', ArtifactType.IMAGE,
             state=ArtifactBuildState.PLANNED,
             original_nvr="foo-1-2")
-        self.build_1.build_args = json.dumps(build_args)
+        self.build_1.build_args = dict(build_args)
 
         self.build_2 = ArtifactBuild.create(
             db.session, self.event, 'build-2', ArtifactType.IMAGE,
             state=ArtifactBuildState.PLANNED,
             original_nvr="foo-2-2")
-        self.build_2.build_args = json.dumps(build_args)
+        self.build_2.build_args = dict(build_args)
 
         db.session.commit()
 
@@ -208,9 +207,9 @@ class TestGetRepoURLs(helpers.ModelsTestCase):
     def test_build_image_artifact_build_renewed_odcs_composes(
             self, build_container, time):
         time.return_value = 1234567.1234
-        build_args = json.loads(self.build_1.build_args)
+        build_args = dict(self.build_1.build_args)
         build_args["renewed_odcs_compose_ids"] = [7300, 7301]
-        self.build_1.build_args = json.dumps(build_args)
+        self.build_1.build_args = build_args
         db.session.commit()
 
         handler = MyHandler()
@@ -246,12 +245,12 @@ class TestGetRepoURLs(helpers.ModelsTestCase):
             db.session, self.event, 'flatpak-build-1', ArtifactType.IMAGE,
             state=ArtifactBuildState.PLANNED,
             original_nvr="foo-1-2")
-        build_args = json.loads(self.build_1.build_args)
+        build_args = dict(self.build_1.build_args)
         build_args.update({
             "flatpak": True,
             "renewed_odcs_compose_ids": [7300],
         })
-        flatpak_build.build_args = json.dumps(build_args)
+        flatpak_build.build_args = build_args
         db.session.add(
             ArtifactBuildCompose(build_id=flatpak_build.id, compose_id=self.compose_1.id))
 
@@ -571,7 +570,7 @@ class TestStartToBuildImages(helpers.ModelsTestCase):
             db.session, db_event, 'foobar-2-123',
             'image', state=ArtifactBuildState.PLANNED.value
         )
-        build.build_args = json.dumps({'repo': 'foobar'})
+        build.build_args = {'repo': 'foobar'}
         build.original_nvr = 'foobar-2-123'
         db.session.commit()
         handler = MyHandler()
@@ -23,10 +23,14 @@
 import datetime
 from unittest.mock import patch
 
+from sqlalchemy import inspect
+from sqlalchemy.exc import IntegrityError
+
 from freshmaker import db, events
 from freshmaker.models import ArtifactBuild, ArtifactType
 from freshmaker.models import Event, EventState, EVENT_TYPES, EventDependency
 from freshmaker.models import Compose, ArtifactBuildCompose
+from freshmaker.models import User, commit_on_success, transactional
 from freshmaker.types import ArtifactBuildState, RebuildReason
 from freshmaker.events import ErrataAdvisoryRPMsSignedEvent
 from tests import helpers
@@ -42,6 +46,12 @@ class TestModels(helpers.ModelsTestCase):
             self.assertEqual(db_event.id, 1)
             self.assertEqual(db_event.message_id, 'msg-1')
 
+    def test_get_by_event_id(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        db.session.commit()
+        self.assertIs(Event.get_by_event_id(db.session, event.id), event)
+        self.assertIsNone(Event.get_by_event_id(db.session, event.id + 1))
+
     def test_creating_event_and_builds(self):
         event = Event.create(db.session, "test_msg_id", "RHSA-2017-284", events.TestingEvent)
         build = ArtifactBuild.create(db.session, event, "ed", "module", 1234,
@@ -71,18 +81,58 @@ class TestModels(helpers.ModelsTestCase):
         self.assertEqual(e.builds[1].dep_on.name, "ed")
         self.assertEqual(e.builds[1].rebuild_reason, RebuildReason.DEPENDENCY.value)
 
+    def test_create_many_builds(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        parent = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
+        db.session.commit()
+
+        ArtifactBuild.create_many(db.session, event, [
+            {"name": "mksh", "type": "module", "build_id": 1235,
+             "dep_on_id": parent.id},
+            {"name": "runtime", "type": ArtifactType.IMAGE,
+             "state": "failed", "original_nvr": "runtime-1-1",
+             "rebuild_reason": RebuildReason.DEPENDENCY.value},
+        ])
+        db.session.commit()
+        db.session.expire_all()
+
+        builds = event.builds.all()
+        self.assertEqual([b.name for b in builds], ["ed", "mksh", "runtime"])
+        self.assertEqual(builds[1].dep_on, parent)
+        self.assertEqual(builds[1].state, ArtifactBuildState.BUILD.value)
+        self.assertEqual(builds[1].type, ArtifactType.MODULE.value)
+        self.assertEqual(builds[2].state, ArtifactBuildState.FAILED.value)
+        self.assertEqual(builds[2].type, ArtifactType.IMAGE.value)
+        self.assertEqual(builds[2].original_nvr, "runtime-1-1")
+        self.assertEqual(builds[2].rebuild_reason, RebuildReason.DEPENDENCY.value)
+        self.assertEqual(builds[1].time_submitted, builds[2].time_submitted)
+
+    def test_create_builds_with_same_time_submitted(self):
+        now = datetime.datetime(2017, 8, 21, 13, 42, 20)
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build1 = ArtifactBuild.create(db.session, event, "ed", "module", 1234, now=now)
+        build2 = ArtifactBuild.create(db.session, event, "mksh", "module", 1235, now=now)
+        db.session.commit()
+
+        self.assertEqual(build1.time_submitted, now)
+        self.assertEqual(build2.time_submitted, now)
+
     def test_get_root_dep_on(self):
         event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
         build1 = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
         build2 = ArtifactBuild.create(db.session, event, "mksh", "module", 1235, build1)
         build3 = ArtifactBuild.create(db.session, event, "runtime", "module", 1236, build2)
         build4 = ArtifactBuild.create(db.session, event, "perl-runtime", "module", 1237, build3)
+        self.assertEqual(build1.get_root_dep_on(), None)
+        self.assertEqual(build4.get_root_dep_on(), build1)
         db.session.commit()
         db.session.expire_all()
         self.assertEqual(build1.get_root_dep_on(), None)
         self.assertEqual(build2.get_root_dep_on(), build1)
         self.assertEqual(build3.get_root_dep_on(), build1)
         self.assertEqual(build4.get_root_dep_on(), build1)
+        # The chain is resolved without lazy loading the dep_on relationship.
+        self.assertNotIn("dep_on", inspect(build4).dict)
 
     def test_depending_artifact_builds(self):
         event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
@@ -95,6 +145,41 @@ class TestModels(helpers.ModelsTestCase):
         deps = set(parent.depending_artifact_builds())
         self.assertEqual(deps, set([build2, build3]))
 
+    def test_has_all_builds_in_state(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build1 = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
+        ArtifactBuild.create(db.session, event, "mksh", "module", 1235)
+        db.session.commit()
+
+        self.assertTrue(event.has_all_builds_in_state(ArtifactBuildState.BUILD.value))
+        self.assertFalse(event.has_all_builds_in_state(ArtifactBuildState.DONE.value))
+
+        build1.state = ArtifactBuildState.DONE.value
+        db.session.commit()
+        self.assertFalse(event.has_all_builds_in_state(ArtifactBuildState.BUILD.value))
+        self.assertFalse(event.has_all_builds_in_state(ArtifactBuildState.DONE.value))
+
+    def test_has_any_failed_or_active_build(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        db.session.commit()
+        self.assertFalse(event.has_any_failed_build())
+        self.assertFalse(event.has_any_active_build())
+
+        build1 = ArtifactBuild.create(
+            db.session, event, "ed", "module", 1234,
+            state=ArtifactBuildState.PLANNED.value)
+        ArtifactBuild.create(
+            db.session, event, "mksh", "module", 1235,
+            state=ArtifactBuildState.DONE.value)
+        db.session.commit()
+        self.assertFalse(event.has_any_failed_build())
+        self.assertTrue(event.has_any_active_build())
+
+        build1.state = ArtifactBuildState.FAILED.value
+        db.session.commit()
+        self.assertTrue(event.has_any_failed_build())
+        self.assertFalse(event.has_any_active_build())
+
     def test_event_transition(self):
         for i, state in enumerate([
                 EventState.COMPLETE, EventState.COMPLETE.value, "complete"]):
@@ -126,6 +211,26 @@ class TestModels(helpers.ModelsTestCase):
             self.assertEqual(build4.state, ArtifactBuildState.BUILD.value)
             self.assertEqual(build4.state_reason, None)
 
+    def test_build_transition_recursion_stops_at_builds_in_same_state(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build1 = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
+        build2 = ArtifactBuild.create(
+            db.session, event, "mksh", "module", 1235, build1,
+            state=ArtifactBuildState.FAILED.value)
+        build3 = ArtifactBuild.create(db.session, event, "runtime", "module", 1236, build2)
+        build4 = ArtifactBuild.create(db.session, event, "perl-runtime", "module", 1237, build1)
+        db.session.commit()
+
+        build1.transition(ArtifactBuildState.FAILED.value, "reason")
+
+        self.assertEqual(build2.state_reason, None)
+        self.assertEqual(build3.state, ArtifactBuildState.BUILD.value)
+        self.assertEqual(build4.state, ArtifactBuildState.FAILED.value)
+        self.assertEqual(
+            build4.state_reason, "Cannot build artifact, because its "
+            "dependency cannot be built.")
+        self.assertEqual(build4.time_completed, build1.time_completed)
+
     def test_build_transition_recursion_not_done_for_ok_states(self):
         for i, state in enumerate([ArtifactBuildState.DONE.value,
                                    ArtifactBuildState.PLANNED.value]):
@@ -144,6 +249,33 @@ class TestModels(helpers.ModelsTestCase):
                 self.assertEqual(build4.state, ArtifactBuildState.BUILD.value)
                 self.assertEqual(build4.state_reason, None)
 
+    @patch('freshmaker.models.messaging.publish')
+    @patch('freshmaker.models.log')
+    def test_build_transition_to_same_state(self, log, publish):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
+        db.session.commit()
+
+        self.assertFalse(build.transition(ArtifactBuildState.BUILD.value, "reason"))
+        self.assertEqual(build.state_reason, None)
+        log.info.assert_not_called()
+        publish.assert_not_called()
+
+    def test_depending_on_many(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build1 = ArtifactBuild.create(db.session, event, "ed", "module", 1234)
+        build2 = ArtifactBuild.create(db.session, event, "mksh", "module", 1235, build1)
+        build3 = ArtifactBuild.create(db.session, event, "runtime", "module", 1236, build1)
+        build4 = ArtifactBuild.create(db.session, event, "perl-runtime", "module", 1237, build2)
+        db.session.commit()
+
+        depending = ArtifactBuild.depending_on_many(
+            db.session, [build1.id, build2.id, build3.id])
+        self.assertEqual(depending[build1.id], [build2, build3])
+        self.assertEqual(depending[build2.id], [build4])
+        self.assertEqual(depending[build3.id], [])
+        self.assertEqual(build1.depending_artifact_builds(), [build2, build3])
+
     def test_get_unreleased(self):
         event1 = Event.create(db.session, "test_msg_id1", "test", events.TestingEvent)
         event1.state = EventState.COMPLETE
@@ -209,6 +341,37 @@ class TestModels(helpers.ModelsTestCase):
             'depends_on_events': [],
         })
 
+    def test_build_list_json(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build = ArtifactBuild.create(db.session, event, "ed", "image", 1234)
+        build.build_args = {"arch": "x86_64"}
+        ArtifactBuild.create(db.session, event, "mksh", "image", 1235, build)
+        compose = Compose(odcs_compose_id=5)
+        db.session.add(compose)
+        db.session.commit()
+        build.add_composes(db.session, [compose])
+        db.session.commit()
+
+        builds_json = ArtifactBuild.list_json(db.session, event.id)
+        self.assertEqual(builds_json, [b.json() for b in event.builds])
+        self.assertEqual(builds_json[0]["odcs_composes"], [5])
+        self.assertEqual(builds_json[1]["dep_on"], "ed")
+        self.assertEqual(event.json()["builds"], builds_json)
+
+    def test_build_list_json_includes_pending_changes(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        build = ArtifactBuild.create(db.session, event, "ed", "image", 1234)
+        db.session.commit()
+        event_id = event.id
+
+        build.state = ArtifactBuildState.DONE.value
+        ArtifactBuild.create(db.session, event, "mksh", "image", 1235)
+
+        builds_json = ArtifactBuild.list_json(db.session, event_id)
+        self.assertEqual(
+            [(b["name"], b["state_name"]) for b in builds_json],
+            [("ed", "DONE"), ("mksh", "BUILD")])
+
     def test_get_rebuilt_original_nvrs_by_search_key(self):
         event = Event.create(db.session, "test_msg_id", "12345", events.TestingEvent)
         ArtifactBuild.create(db.session, event, "foo", "image", 1001,
@@ -229,6 +392,74 @@ class TestModels(helpers.ModelsTestCase):
         self.assertEqual(sorted(nvrs), ["bar-3-30", "foo-2-20"])
 
 
+class TestTransactional(helpers.ModelsTestCase):
+    """Test transactional and commit_on_success"""
+
+    def test_commit_on_success(self):
+        create_user = commit_on_success(User.create_user)
+        create_user("tester2")
+        db.session.rollback()
+
+        self.assertIsNotNone(User.find_user_by_name("tester2"))
+
+    def test_rollback_on_failure(self):
+        @commit_on_success
+        def create_user(username):
+            User.create_user(username)
+            raise ValueError("failure")
+
+        with self.assertRaises(ValueError):
+            create_user("tester2")
+
+        self.assertIsNone(User.find_user_by_name("tester2"))
+
+    @patch("freshmaker.models.db.session.commit")
+    def test_nested_calls_commit_once(self, commit):
+        create_user = commit_on_success(User.create_user)
+        with transactional():
+            create_user("tester2")
+            create_user("tester3")
+            commit.assert_not_called()
+
+        commit.assert_called_once_with()
+
+    def test_nested_failure_rolls_back_nested_changes(self):
+        @commit_on_success
+        def create_user(username):
+            User.create_user(username)
+            raise ValueError("failure")
+
+        with transactional():
+            User.create_user("tester2")
+            with self.assertRaises(ValueError):
+                create_user("tester3")
+
+        self.assertIsNotNone(User.find_user_by_name("tester2"))
+        self.assertIsNone(User.find_user_by_name("tester3"))
+
+    def test_rollback_on_failed_commit(self):
+        Event.create(db.session, "msg_id", "test", events.TestingEvent)
+        db.session.commit()
+
+        with self.assertRaises(IntegrityError):
+            with transactional():
+                Event.create(db.session, "msg_id", "test", events.TestingEvent)
+
+        # The session is usable again after the failed commit.
+        with transactional():
+            User.create_user("tester2")
+        self.assertIsNotNone(User.find_user_by_name("tester2"))
+
+    def test_outer_failure_rolls_back_nested_changes(self):
+        create_user = commit_on_success(User.create_user)
+        with self.assertRaises(ValueError):
+            with transactional():
+                create_user("tester2")
+                raise ValueError("failure")
+
+        self.assertIsNone(User.find_user_by_name("tester2"))
+
+
 class TestFindDependentEvents(helpers.ModelsTestCase):
     """Test Event.find_dependent_events"""
 
@@ -438,13 +669,31 @@ class TestEventDependency(helpers.ModelsTestCase):
         self.assertEqual(event.event_dependencies, [event1])
         self.assertEqual(event1.depending_events, [event])
 
+    def test_add_dependent_events(self):
+        event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
+        event1 = Event.create(db.session, "test_msg_id2", "test2", events.TestingEvent)
+        event2 = Event.create(db.session, "test_msg_id3", "test3", events.TestingEvent)
+        db.session.commit()
+        event.add_event_dependency(db.session, event1)
+        db.session.commit()
+
+        event.add_event_dependencies(db.session, [event1, event2])
+        db.session.commit()
+
+        self.assertEqual(
+            sorted(e.id for e in event.event_dependencies), [event1.id, event2.id])
+        self.assertEqual(event2.depending_events, [event])
+        self.assertEqual(db.session.query(EventDependency).count(), 2)
+
     def test_return_added_dependency_relationship(self):
         event = Event.create(db.session, "test_msg_id", "test", events.TestingEvent)
         event1 = Event.create(db.session, "test_msg_id2", "test2", events.TestingEvent)
         db.session.commit()
 
-        dep_rel = event.add_event_dependency(db.session, event1)
+        dep = event.add_event_dependency(db.session, event1)
         db.session.commit()
 
+        self.assertEqual(event1, dep)
+        dep_rel = db.session.query(EventDependency).one()
         self.assertEqual(event.id, dep_rel.event_id)
         self.assertEqual(event1.id, dep_rel.event_dependency_id)
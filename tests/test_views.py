@@ -125,7 +125,7 @@ class TestViews(helpers.ModelsTestCase):
     def _init_data(self):
         event = models.Event.create(db.session, "2017-00000000-0000-0000-0000-000000000001", "101", events.TestingEvent)
         build = models.ArtifactBuild.create(db.session, event, "ed", "module", 1234)
-        build.build_args = '{"key": "value"}'
+        build.build_args = {"key": "value"}
         models.ArtifactBuild.create(db.session, event, "mksh", "module", 1235)
         models.ArtifactBuild.create(db.session, event, "bash", "module", 1236)
         models.Event.create(db.session, "2017-00000000-0000-0000-0000-000000000002", "102", events.TestingEvent)
@@ -720,7 +720,7 @@ class TestViewsMultipleFilterValues(helpers.ModelsTestCase):
             "101", events.TestingEvent)
         event.state = EventState.BUILDING.value
         build = models.ArtifactBuild.create(db.session, event, "ed", "module", 1234)
-        build.build_args = '{"key": "value"}'
+        build.build_args = {"key": "value"}
         models.ArtifactBuild.create(db.session, event, "mksh", "module", 1235)
         models.ArtifactBuild.create(db.session, event, "bash", "module", 1236)
         event2 = models.Event.create(